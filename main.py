@@ -3,6 +3,9 @@ import os
 import sys
 import time
 import asyncio
+import copy
+import json
+import math
 import logging
 import requests
 import gspread
@@ -10,6 +13,8 @@ from datetime import datetime
 from oauth2client.service_account import ServiceAccountCredentials
 from telethon import TelegramClient, events, errors, Button
 from telethon.tl.types import InputPeerChannel, PeerUser
+from telethon.extensions import markdown as tg_markdown
+from telethon.helpers import add_surrogate, del_surrogate
 import openai
 from tenacity import (
     retry,
@@ -40,20 +45,53 @@ SHEET_ID = "11qcSUsmzvUxg_8BKr4uPJSow_eXhJLOgJ1aL_QoRceo"
 # Image Settings
 IMAGE_BASE_DIR = "images"  # Base directory for images
 
+# Telegram limits (in UTF-16 code units, after Markdown is parsed)
+CAPTION_MAX_LENGTH = 1024
+MESSAGE_MAX_LENGTH = 4096
+
 # System
 MAX_RETRIES = 10
 FLOOD_WAIT_MAX = 300  # 5 minutes
 RECONNECT_BASE_DELAY = 10
 APPROVAL_TIMEOUT = 600  # 10 minutes for approval
+APPROVAL_REMINDER_BEFORE = 120  # Remind admin 2 minutes before expiry
+APPROVAL_EXTEND_SECONDS = 600  # Extra time granted by the "Extend" button
+STATE_CHECK_INTERVAL = 30  # How often expiry/reminders are checked
+ARCHIVE_DIR = "archive"  # Expired drafts are stored here for /resume
+
+# Approval stages (time-in-state is tracked for each of them)
+STAGE_GENERATED = 'generated'
+STAGE_AWAITING_FEEDBACK = 'awaiting_feedback'
+STAGE_EDITING = 'editing'  # LLM edit in progress, not human wait
+STAGE_TEXT_APPROVED = 'text_approved'
+STAGE_IMAGE_APPROVED = 'image_approved'
+STAGE_PUBLISHED = 'published'
+STAGES = [
+    STAGE_GENERATED,
+    STAGE_AWAITING_FEEDBACK,
+    STAGE_EDITING,
+    STAGE_TEXT_APPROVED,
+    STAGE_IMAGE_APPROVED,
+    STAGE_PUBLISHED
+]
+# Stages where the bot is working: no reminders or expiry, deadline paused
+MACHINE_STAGES = {STAGE_EDITING, STAGE_IMAGE_APPROVED}
 
 # ====== STATE MANAGEMENT ====== #
 class ApprovalState:
     def __init__(self):
         self.states = {}
         self.lock = asyncio.Lock()
+        # Wait-time samples per stage (seconds), kept for /stats
+        self.stage_waits = {stage: [] for stage in STAGES}
+        self.expired_by_stage = {stage: 0 for stage in STAGES}
+        # Waits cut short by expiry, cancel or failed publish
+        self.unfinished_waits = {stage: [] for stage in STAGES}
+        self.end_to_end = []
     
     async def create_state(self, user_id, topic, text, image_path):
         async with self.lock:
+            now = time.time()
             self.states[user_id] = {
                 'topic': topic,
                 'text': text,
@@ -66,7 +104,13 @@ class ApprovalState:
                 'text_feedback': None,
                 'image_feedback': None,
                 'awaiting_feedback': None,  # 'text' или 'image'
-                'edit_history': []  # История правок текста
+                'edit_history': [],  # История правок текста
+                'stage': STAGE_GENERATED,
+                'stage_entered_at': now,
+                'stage_history': [],  # Завершённые этапы и время в них
+                'expires_at': now + APPROVAL_TIMEOUT,
+                'reminder_sent': False,
+                'published_parts': 0  # Части поста, уже отправленные в канал
             }
     
     async def get_state(self, user_id):
@@ -83,6 +127,15 @@ class ApprovalState:
             if user_id in self.states:
                 del self.states[user_id]
     
+    async def discard_state(self, user_id):
+        """Удаляет незавершённую сессию, сохраняя время в текущем этапе"""
+        async with self.lock:
+            if user_id in self.states:
+                self._record_unfinished(self.states.pop(user_id), time.time())
+    
+    def _record_unfinished(self, state, now):
+        self.unfinished_waits[state['stage']].append(now - state['stage_entered_at'])
+    
     async def add_edit(self, user_id, text, feedback):
         """Добавляет версию текста в историю правок"""
         async with self.lock:
@@ -102,16 +155,123 @@ class ApprovalState:
                 return self.states[user_id]['text']
             return None
     
+    async def restore_state(self, user_id, archived):
+        """Восстанавливает сессию из архива без повторной генерации"""
+        await self.create_state(
+            user_id,
+            archived['topic'],
+            archived['text'],
+            archived['image_path']
+        )
+        async with self.lock:
+            self.states[user_id].update({
+                'text_approved': archived.get('text_approved', False),
+                'edit_history': archived.get('edit_history', []),
+                'stage_history': archived.get('stage_history', []),
+                'created_at': archived.get('created_at', time.time()),
+                'published_parts': archived.get('published_parts', 0),
+                'stage': (
+                    STAGE_TEXT_APPROVED if archived.get('text_approved')
+                    else STAGE_GENERATED
+                )
+            })
+    
+    async def set_stage(self, user_id, stage):
+        """Переводит сессию в новый этап и записывает время в предыдущем.
+        
+        Возвращает False, если сессии уже нет.
+        """
+        async with self.lock:
+            state = self.states.get(user_id)
+            if not state:
+                return False
+            if state['stage'] == stage:
+                return True
+            now = time.time()
+            previous = state['stage']
+            waited = now - state['stage_entered_at']
+            state['stage_history'].append({
+                'stage': previous,
+                'seconds': round(waited, 1)
+            })
+            self.stage_waits[previous].append(waited)
+            if previous in MACHINE_STAGES:
+                # Bot work does not count against the admin's deadline
+                state['expires_at'] += waited
+            state['stage'] = stage
+            state['stage_entered_at'] = now
+            if stage == STAGE_PUBLISHED:
+                self.end_to_end.append(now - state['created_at'])
+            logger.info(f"⏱️ Session {user_id}: {previous} → {stage} after {waited:.0f}s")
+            return True
+    
+    async def extend(self, user_id, seconds=APPROVAL_EXTEND_SECONDS):
+        """Продлевает срок жизни сессии"""
+        async with self.lock:
+            if user_id in self.states:
+                state = self.states[user_id]
+                state['expires_at'] = max(state['expires_at'], time.time()) + seconds
+                state['reminder_sent'] = False
+                return state['expires_at']
+            return None
+    
+    async def collect_reminders(self):
+        """Returns sessions close to expiry that were not reminded yet"""
+        async with self.lock:
+            current_time = time.time()
+            due = []
+            for uid, state in self.states.items():
+                if state['stage'] in MACHINE_STAGES:
+                    continue
+                remaining = state['expires_at'] - current_time
+                if 0 < remaining <= APPROVAL_REMINDER_BEFORE and not state['reminder_sent']:
+                    state['reminder_sent'] = True
+                    due.append((uid, remaining))
+            return due
+    
     async def cleanup_expired(self):
+        """Removes expired sessions and returns them for archiving"""
         async with self.lock:
             current_time = time.time()
-            expired_users = [
-                uid for uid, state in self.states.items()
-                if current_time - state['created_at'] > APPROVAL_TIMEOUT
-            ]
-            for uid in expired_users:
+            expired = {
+                uid: state for uid, state in self.states.items()
+                if state['stage'] not in MACHINE_STAGES
+                and current_time > state['expires_at']
+            }
+            for uid, state in expired.items():
+                self.expired_by_stage[state['stage']] += 1
+                self._record_unfinished(state, current_time)
                 del self.states[uid]
-            return len(expired_users)
+            return expired
+    
+    async def get_stage_report(self):
+        """Per-stage wait-time distribution as a Markdown report"""
+        async with self.lock:
+            lines = ["**⏱️ Approval latency by stage:**"]
+            for stage in STAGES:
+                if stage == STAGE_PUBLISHED:
+                    continue
+                lines.append(
+                    f"`{stage}`: {format_distribution(self.stage_waits[stage])}; "
+                    f"unfinished: {format_distribution(self.unfinished_waits[stage])}; "
+                    f"expired here: {self.expired_by_stage[stage]}"
+                )
+            lines.append(f"`end-to-end`: {format_distribution(self.end_to_end)}")
+            return "\n".join(lines)
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a non-empty sample list"""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+def format_distribution(samples):
+    if not samples:
+        return "no data"
+    return (
+        f"n={len(samples)}, p50={percentile(samples, 50):.0f}s, "
+        f"p90={percentile(samples, 90):.0f}s, max={max(samples):.0f}s"
+    )
 
 # Global state manager
 approval_manager = ApprovalState()
@@ -281,31 +441,142 @@ def get_today_image():
         logger.error(f"Image retrieval failed: {e}")
         return None
 
+# ====== PUBLISH FORMATTER ====== #
+# Split points in order of preference: paragraph, line, sentence, word
+SPLIT_SEPARATORS = ['\n\n', '\n', '. ', '! ', '? ', '… ', ' ']
+
+def is_inside_entity(position, entities):
+    """True if cutting at position would break an entity in two"""
+    return any(e.offset < position < e.offset + e.length for e in entities)
+
+def find_split_position(text, start, limit, entities):
+    """Best cut position in UTF-16 text for a chunk starting at start"""
+    window_end = start + limit
+    # Cuts in the first half of the window would leave tiny messages
+    min_position = start + limit // 2
+    
+    # Prefer boundaries outside entities; slice_entities clips the rest
+    for keep_entities in (True, False):
+        for separator in SPLIT_SEPARATORS:
+            index = text.rfind(separator, start, window_end)
+            while index >= 0 and index + len(separator) > min_position:
+                position = index + len(separator)
+                if not keep_entities or not is_inside_entity(position, entities):
+                    return position
+                index = text.rfind(separator, start, index)
+    
+    # No clean boundary: hard cut, but never between a surrogate pair
+    position = window_end
+    if '\ud800' <= text[position - 1] <= '\udbff':
+        position -= 1
+    return position
+
+def slice_entities(entities, start, end):
+    """Entities clipped to [start, end) and shifted to the chunk start"""
+    sliced = []
+    for entity in entities:
+        entity_start = max(entity.offset, start)
+        entity_end = min(entity.offset + entity.length, end)
+        if entity_end > entity_start:
+            part = copy.copy(entity)
+            part.offset = entity_start - start
+            part.length = entity_end - entity_start
+            sliced.append(part)
+    return sliced
+
+def split_formatted(text, entities, limit):
+    """Split parsed text into (text, entities) chunks within limit UTF-16 units"""
+    text = add_surrogate(text)
+    chunks = []
+    start = 0
+    
+    while start < len(text):
+        # Chunks never start or end with whitespace
+        while start < len(text) and text[start].isspace():
+            start += 1
+        if start >= len(text):
+            break
+        
+        end = len(text)
+        if end - start > limit:
+            end = find_split_position(text, start, limit, entities)
+        next_start = end
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        
+        chunks.append((
+            del_surrogate(text[start:end]),
+            slice_entities(entities, start, end)
+        ))
+        start = next_start
+    return chunks
+
+def format_for_publish(markdown_text, has_image=False):
+    """Parse Markdown once and lay the post out for Telegram limits.
+    
+    Returns (caption, messages): caption is a (text, entities) pair for the
+    photo or None, messages is a list of (text, entities) follow-ups.
+    """
+    text, entities = tg_markdown.parse(markdown_text)
+    
+    if has_image and len(add_surrogate(text)) <= CAPTION_MAX_LENGTH:
+        return (text, entities), []
+    
+    # Caption overflow: photo first, then the text as follow-up messages
+    return None, split_formatted(text, entities, MESSAGE_MAX_LENGTH)
+
+def build_publish_parts(text, image_path=None):
+    """Ordered list of channel messages (send kwargs) that make up a post"""
+    caption, messages = format_for_publish(text, has_image=bool(image_path))
+    parts = []
+    
+    if image_path:
+        if caption:
+            caption_text, caption_entities = caption
+            parts.append({
+                'file': image_path,
+                'caption': caption_text,
+                'formatting_entities': caption_entities
+            })
+        else:
+            logger.info("📏 Caption too long, sending photo with follow-up message")
+            parts.append({'file': image_path})
+    
+    for chunk_text, chunk_entities in messages:
+        parts.append({
+            'message': chunk_text,
+            'formatting_entities': chunk_entities
+        })
+    return parts
+
 # ====== TELEGRAM WARRIOR FUNCTIONS ====== #
-async def send_to_channel(client, text, image_path=None):
-    """Tank-grade message sender to channel"""
+async def send_to_channel(client, text, image_path=None, sent_parts=0):
+    """Tank-grade message sender to channel.
+    
+    Parts already delivered (sent_parts) are skipped, so a retry never
+    duplicates them. Returns (success, sent_parts, total_parts).
+    """
+    total_parts = 0
     try:
-        if image_path:
-            # Send with armored caption
-            await client.send_file(
-                entity=CHANNEL_ID,
-                file=image_path,
-                caption=text,
-                parse_mode="Markdown"
-            )
-        else:
-            # Split long messages like a samurai
-            for i in range(0, len(text), 4096):
-                await client.send_message(
-                    entity=CHANNEL_ID,
-                    message=text[i:i+4096],
-                    parse_mode='Markdown'
-                )
+        parts = build_publish_parts(text, image_path)
+        total_parts = len(parts)
+        if not parts:
+            logger.error("Channel Message Delivery Failed: post is empty")
+            return False, sent_parts, total_parts
+        
+        # Split long messages like a samurai
+        for part in parts[sent_parts:]:
+            if 'file' in part:
+                await client.send_file(entity=CHANNEL_ID, **part)
+            else:
+                await client.send_message(entity=CHANNEL_ID, **part)
+            sent_parts += 1
+            if sent_parts < total_parts:
                 await asyncio.sleep(1)  # Respect rate limits
-        return True
+        return True, sent_parts, total_parts
     except Exception as e:
         logger.error(f"Channel Message Delivery Failed: {e}")
-        return False
+        return False, sent_parts, total_parts
 
 @retry(
     stop=stop_after_attempt(3),
@@ -329,6 +600,52 @@ async def send_image_to_admin(bot_client, user_id, image_path, caption, buttons)
         return None
 
 # ====== APPROVAL FLOW FUNCTIONS ====== #
+async def send_text_for_approval(bot_client, user_id, text, title="Generated Text"):
+    """Send text with approval buttons and remember the message ID"""
+    buttons = [
+        [Button.inline("✅ Approve Text", b"approve_text")],
+        [Button.inline("🔄 Edit Text", b"regenerate_text")],
+        [Button.inline("❌ Cancel", b"cancel_approval")]
+    ]
+    
+    msg = await bot_client.send_message(
+        entity=user_id,
+        message=f"**{title}:**\n\n{text}",
+        buttons=buttons,
+        parse_mode='md'
+    )
+    
+    # Save message ID
+    await approval_manager.update_state(
+        user_id,
+        {'text_message_id': msg.id}
+    )
+    return msg
+
+async def send_image_for_approval(bot_client, user_id, image_path):
+    """Send image with approval buttons and remember the message ID"""
+    caption = f"Сегодняшнее изображение для поста"
+    buttons = [
+        [Button.inline("✅ Approve Image", b"approve_image")],
+        [Button.inline("❌ Cancel", b"cancel_approval")]
+    ]
+    
+    # Send image with buttons
+    msg = await send_image_to_admin(
+        bot_client,
+        user_id,
+        image_path,
+        caption,
+        buttons
+    )
+    
+    if msg:
+        await approval_manager.update_state(
+            user_id,
+            {'image_message_id': msg.id}
+        )
+    return msg
+
 async def start_approval_flow(bot_client, user_id, topic):
     """Initiate the post approval workflow"""
     try:
@@ -351,24 +668,7 @@ async def start_approval_flow(bot_client, user_id, topic):
         await approval_manager.add_edit(user_id, text, "Initial generation")
         
         # Send text for approval
-        buttons = [
-            [Button.inline("✅ Approve Text", b"approve_text")],
-            [Button.inline("🔄 Edit Text", b"regenerate_text")],
-            [Button.inline("❌ Cancel", b"cancel_approval")]
-        ]
-        
-        msg = await bot_client.send_message(
-            entity=user_id,
-            message=f"**Generated Text:**\n\n{text}",
-            buttons=buttons,
-            parse_mode='md'
-        )
-        
-        # Save message ID
-        await approval_manager.update_state(
-            user_id, 
-            {'text_message_id': msg.id}
-        )
+        await send_text_for_approval(bot_client, user_id, text)
         
     except Exception as e:
         logger.error(f"Approval Flow Init Failure: {e}")
@@ -385,34 +685,16 @@ async def handle_text_approval(bot_client, event, state):
             user_id, 
             {'text_approved': True}
         )
+        await approval_manager.set_stage(user_id, STAGE_TEXT_APPROVED)
         
         await event.answer("Text approved! Processing image...")
         
-        # Prepare image for approval
-        caption = f"Сегодняшнее изображение для поста"
-        buttons = [
-            [Button.inline("✅ Approve Image", b"approve_image")],
-            [Button.inline("❌ Cancel", b"cancel_approval")]
-        ]
-        
         # Send image with buttons
-        msg = await send_image_to_admin(
-            bot_client,
-            user_id,
-            state['image_path'],
-            caption,
-            buttons
-        )
+        msg = await send_image_for_approval(bot_client, user_id, state['image_path'])
         
         if not msg:
             await event.reply("⚠️ Failed to send image. Please try again.")
             return
-            
-        # Save message ID
-        await approval_manager.update_state(
-            user_id, 
-            {'image_message_id': msg.id}
-        )
         
     elif data == "regenerate_text":
         # Set state to await feedback
@@ -420,6 +702,7 @@ async def handle_text_approval(bot_client, event, state):
             user_id,
             {'awaiting_feedback': 'text'}
         )
+        await approval_manager.set_stage(user_id, STAGE_AWAITING_FEEDBACK)
         
         # Get last text version
         last_text = await approval_manager.get_last_text_version(user_id)
@@ -435,7 +718,7 @@ async def handle_text_approval(bot_client, event, state):
         await event.answer("Awaiting your feedback...")
         
     elif data == "cancel_approval":
-        await approval_manager.delete_state(user_id)
+        await approval_manager.discard_state(user_id)
         await event.answer("Approval cancelled!")
         await bot_client.send_message(user_id, "❌ Post approval cancelled.")
 
@@ -450,6 +733,7 @@ async def handle_image_approval(bot_client, user_client, event, state):
             user_id, 
             {'image_approved': True}
         )
+        await approval_manager.set_stage(user_id, STAGE_IMAGE_APPROVED)
         
         await event.answer("Image approved! Publishing to channel...")
         
@@ -457,22 +741,42 @@ async def handle_image_approval(bot_client, user_client, event, state):
         last_text = await approval_manager.get_last_text_version(user_id)
         
         # Send to channel using main client
-        success = await send_to_channel(
+        success, sent_parts, total_parts = await send_to_channel(
             user_client, 
             last_text, 
-            state['image_path']
+            state['image_path'],
+            sent_parts=state.get('published_parts', 0)
         )
         
         if success:
+            await approval_manager.set_stage(user_id, STAGE_PUBLISHED)
+            await approval_manager.delete_state(user_id)
             await bot_client.send_message(user_id, "✅ Post published successfully!")
         else:
-            await bot_client.send_message(user_id, "⚠️ Failed to publish post. Please try again.")
-        
-        # Cleanup
-        await approval_manager.delete_state(user_id)
+            # Keep the approved draft so it can be retried without regeneration
+            await approval_manager.update_state(user_id, {'published_parts': sent_parts})
+            archived = archive_state(user_id, await approval_manager.get_state(user_id))
+            await approval_manager.discard_state(user_id)
+            if not archived:
+                await bot_client.send_message(
+                    user_id,
+                    f"⚠️ Failed to publish post ({sent_parts} of {total_parts} parts sent) "
+                    "and the draft could not be archived."
+                )
+            elif sent_parts:
+                await bot_client.send_message(
+                    user_id,
+                    f"⚠️ Post partially published ({sent_parts} of {total_parts} parts). "
+                    "Draft archived, use /resume to send only the remaining parts."
+                )
+            else:
+                await bot_client.send_message(
+                    user_id,
+                    "⚠️ Failed to publish post. Draft archived, use /resume to try again."
+                )
         
     elif data == "cancel_approval":
-        await approval_manager.delete_state(user_id)
+        await approval_manager.discard_state(user_id)
         await event.answer("Approval cancelled!")
         await bot_client.send_message(user_id, "❌ Post approval cancelled.")
 
@@ -498,6 +802,7 @@ async def handle_feedback(bot_client, user_client, event, state):
             'text_feedback': feedback_text
         }
     )
+    await approval_manager.set_stage(user_id, STAGE_EDITING)
     
     # Notify user
     await event.reply("🔄 Editing text based on your feedback...")
@@ -510,6 +815,12 @@ async def handle_feedback(bot_client, user_client, event, state):
             topic=state['topic']
         )
         
+        if not await approval_manager.set_stage(user_id, STAGE_GENERATED):
+            await event.reply(
+                f"⚠️ Approval session is no longer active. Edited text:\n\n{edited_text}"
+            )
+            return
+        
         # Add to edit history
         await approval_manager.add_edit(user_id, edited_text, feedback_text)
         
@@ -520,38 +831,118 @@ async def handle_feedback(bot_client, user_client, event, state):
         )
         
         # Show edited text
-        buttons = [
-            [Button.inline("✅ Approve Text", b"approve_text")],
-            [Button.inline("🔄 Edit Text", b"regenerate_text")],
-            [Button.inline("❌ Cancel", b"cancel_approval")]
-        ]
-        
-        msg = await bot_client.send_message(
-            entity=user_id,
-            message=f"**Edited Text:**\n\n{edited_text}",
-            buttons=buttons,
-            parse_mode='md'
-        )
-        
-        # Save message ID
-        await approval_manager.update_state(
-            user_id,
-            {'text_message_id': msg.id}
-        )
+        await send_text_for_approval(bot_client, user_id, edited_text, "Edited Text")
             
     except Exception as e:
         logger.error(f"Text editing failed: {e}")
         await event.reply(f"⚠️ Editing error: {str(e)[:200]}")
+        
+        # Bring back the previous version with its buttons
+        if not await approval_manager.set_stage(user_id, STAGE_GENERATED):
+            await event.reply("⚠️ Approval session is no longer active.")
+            return
+        await send_text_for_approval(bot_client, user_id, last_text, "Current Text")
+
+# ====== DRAFT ARCHIVE ====== #
+def archive_state(user_id, state):
+    """Store a draft on disk so it can be resumed without regeneration"""
+    if not state:
+        return None
+    try:
+        os.makedirs(ARCHIVE_DIR, exist_ok=True)
+        # Nanosecond names keep drafts ordered and never overwrite each other
+        path = os.path.join(ARCHIVE_DIR, f"{user_id}_{time.time_ns()}.json")
+        draft = {
+            'topic': state['topic'],
+            'text': state['text'],
+            'image_path': state['image_path'],
+            'text_approved': state['text_approved'],
+            'edit_history': state['edit_history'],
+            'stage': state['stage'],
+            'stage_history': state['stage_history'],
+            'published_parts': state.get('published_parts', 0),
+            'created_at': state['created_at'],
+            'archived_at': time.time()
+        }
+        with open(path, 'x', encoding='utf-8') as f:
+            json.dump(draft, f, ensure_ascii=False, indent=2)
+        logger.info(f"📦 Draft archived: {path}")
+        return path
+    except Exception as e:
+        logger.error(f"Draft archive failed: {e}")
+        return None
+
+def pop_archived_state(user_id):
+    """Load and remove the most recent archived draft of a user"""
+    if not os.path.exists(ARCHIVE_DIR):
+        return None
+    prefix = f"{user_id}_"
+    drafts = sorted(
+        (f for f in os.listdir(ARCHIVE_DIR) if f.startswith(prefix) and f.endswith('.json')),
+        key=lambda f: int(f[len(prefix):-len('.json')])
+    )
+    if not drafts:
+        return None
+    path = os.path.join(ARCHIVE_DIR, drafts[-1])
+    with open(path, encoding='utf-8') as f:
+        draft = json.load(f)
+    os.remove(path)
+    return draft
+
+async def resume_approval_flow(bot_client, user_id):
+    """Restore the latest archived draft and continue where it stopped"""
+    if await approval_manager.get_state(user_id):
+        await bot_client.send_message(user_id, "⚠️ Approval session is already active.")
+        return
+    
+    draft = pop_archived_state(user_id)
+    if not draft:
+        await bot_client.send_message(user_id, "📭 No archived drafts to resume.")
+        return
+    
+    await approval_manager.restore_state(user_id, draft)
+    last_text = await approval_manager.get_last_text_version(user_id)
+    
+    if draft.get('published_parts'):
+        await bot_client.send_message(
+            user_id,
+            f"📨 {draft['published_parts']} part(s) of this post are already in the channel. "
+            "Approving the image sends only the remaining parts."
+        )
+    
+    if draft.get('text_approved'):
+        msg = await send_image_for_approval(bot_client, user_id, draft['image_path'])
+        if not msg:
+            await bot_client.send_message(user_id, "⚠️ Failed to send image. Please try again.")
+    else:
+        await send_text_for_approval(bot_client, user_id, last_text, "Resumed Text")
 
 # ====== STATE CLEANUP TASK ====== #
-async def state_cleanup_task():
-    """Periodically clean up expired approval states"""
+async def state_cleanup_task(bot_client):
+    """Remind about expiring approval states and archive expired ones"""
     while True:
         try:
-            cleaned = await approval_manager.cleanup_expired()
-            if cleaned > 0:
-                logger.info(f"🧹 Cleaned up {cleaned} expired approval states")
-            await asyncio.sleep(300)  # Run every 5 minutes
+            for uid, remaining in await approval_manager.collect_reminders():
+                await bot_client.send_message(
+                    uid,
+                    f"⏰ Approval session expires in {math.ceil(remaining / 60)} min.",
+                    buttons=[[Button.inline(
+                        f"⏳ Extend {APPROVAL_EXTEND_SECONDS // 60} min",
+                        b"extend_session"
+                    )]]
+                )
+            
+            expired = await approval_manager.cleanup_expired()
+            for uid, state in expired.items():
+                archive_state(uid, state)
+                await bot_client.send_message(
+                    uid,
+                    f"📦 Approval session expired at stage `{state['stage']}`. "
+                    "Draft archived, use /resume to continue."
+                )
+            if expired:
+                logger.info(f"🧹 Archived {len(expired)} expired approval states")
+            await asyncio.sleep(STATE_CHECK_INTERVAL)
         except Exception as e:
             logger.error(f"State cleanup error: {e}")
             await asyncio.sleep(60)
@@ -563,8 +954,8 @@ async def run_bot(user_client):
     me = await bot_client.get_me()
     logger.info(f"🤖 Approval Bot started as @{me.username}")
     
-    # Start state cleanup task
-    asyncio.create_task(state_cleanup_task())
+    # Start state cleanup task (bound to this bot client, cancelled on exit)
+    cleanup_task = asyncio.create_task(state_cleanup_task(bot_client))
     
     # Command handler
     @bot_client.on(events.NewMessage(pattern='/generate'))
@@ -580,12 +971,36 @@ async def run_bot(user_client):
             logger.error(f"Generate Command Failure: {e}")
             await event.reply(f"⚠️ Command failed: {str(e)[:200]}")
 
+    # Resume command handler
+    @bot_client.on(events.NewMessage(pattern='/resume'))
+    async def resume_handler(event):
+        if event.sender_id != ADMIN_ID:
+            await event.reply("🚫 You are not authorized to use this command.")
+            return
+            
+        try:
+            await resume_approval_flow(bot_client, event.sender_id)
+        except Exception as e:
+            logger.error(f"Resume Command Failure: {e}")
+            await event.reply(f"⚠️ Command failed: {str(e)[:200]}")
+
+    # Stats command handler
+    @bot_client.on(events.NewMessage(pattern='/stats'))
+    async def stats_handler(event):
+        if event.sender_id != ADMIN_ID:
+            await event.reply("🚫 You are not authorized to use this command.")
+            return
+            
+        await event.reply(await approval_manager.get_stage_report(), parse_mode='md')
+
     # Start command handler
     @bot_client.on(events.NewMessage(pattern='/start'))
     async def start_handler(event):
         if event.sender_id == ADMIN_ID:
             await event.reply("🦾 Terminator Bot v4.0 Activated!\n"
-                             "Use /generate to create new post")
+                             "Use /generate to create new post\n"
+                             "Use /resume to continue an archived draft\n"
+                             "Use /stats to see approval latency")
         else:
             await event.reply("⛔ Access Denied")
 
@@ -601,6 +1016,15 @@ async def run_bot(user_client):
             await event.answer("❌ No active approval session!")
             return
             
+        if event.data == b"extend_session":
+            expires_at = await approval_manager.extend(event.sender_id)
+            if expires_at is None:
+                await event.answer("❌ No active approval session!")
+                return
+            remaining = math.ceil((expires_at - time.time()) / 60)
+            await event.answer(f"⏳ Session extended, {remaining} min left")
+            return
+            
         try:
             # Handle based on current state
             if not state['text_approved']:
@@ -625,7 +1049,10 @@ async def run_bot(user_client):
         # Process feedback
         await handle_feedback(bot_client, user_client, event, state)
     
-    await bot_client.run_until_disconnected()
+    try:
+        await bot_client.run_until_disconnected()
+    finally:
+        cleanup_task.cancel()
 
 async def immortal_bot():
     """Phoenix-like bot that never dies"""